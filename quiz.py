@@ -1,13 +1,20 @@
 import os
+import argparse
 import asyncio
 import logging
-import json
+import random
+import re
 import hashlib
+import sqlite3
+from collections import deque
 from datetime import datetime
 from telegram import Bot, Poll
 from telegram.error import TelegramError
-from openai import OpenAI
+from telegram.request import HTTPXRequest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from dotenv import load_dotenv
+import orjson
 
 # Load environment variables
 load_dotenv()
@@ -33,69 +40,229 @@ if not CHANNEL_ID:
     logger.error("CHANNEL_ID not found in environment variables. Please set it in the .env file.")
     exit(1)
 
-# Initialize OpenAI client
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Initialize OpenAI client (shared across calls so the HTTP/2 connection is reused)
+client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=DefaultAsyncHttpxClient(http2=True))
 
-# Path to store asked questions
-QUESTIONS_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'asked_questions.json')
+# Path to store asked questions, and the older JSON store imported on first run
+QUESTIONS_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'asked_questions.db')
+LEGACY_QUESTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'asked_questions.json')
+# Path to store generated questions that have not been sent yet
+QUESTION_QUEUE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'question_queue.json')
+
+# Number of questions requested from OpenAI per call; the rest wait in the queue
+QUESTION_BATCH_SIZE = 24
+
+# Prefixes of option lines such as "A) option / विकल्प"
+_OPT_PREFIXES = frozenset({"A) ", "B) ", "C) ", "D) "})
+# Correct answer line in English or Hindi, e.g. "Correct: A" or "सही उत्तर: ए"
+_ANS_RE = re.compile(r'(?:Correct|सही उत्तर)\s*:\s*([A-D]|ए|बी|सी|डी)')
+_HINDI_TO_ENG = {'ए': 'A', 'बी': 'B', 'सी': 'C', 'डी': 'D'}
+_VALID_LETTERS = frozenset('ABCD')
+# Poll explanation for each correct_index
+_EXPLANATIONS = tuple(f"Correct answer: {c}" for c in "ABCD")
+
+# Main instruction message, identical on every call
+_INSTRUCTION_CONTENT = "Generate a challenging multiple choice question for UPSC/SSC CGL exam preparation. Follow this EXACT format and example:\n\nExample Output:\nWho was the first President of India?\nभारत के प्रथम राष्ट्रपति कौन थे?\n\nA) Dr. Rajendra Prasad / डॉ राजेंद्र प्रसाद\nB) Jawaharlal Nehru / जवाहरलाल नेहरू\nC) Sardar Vallabhbhai Patel / सरदार वल्लभभाई पटेल\nD) Dr. A.P.J. Abdul Kalam / डॉ ए पी जे अब्दुल कलाम\n\nCorrect: A\n\nRequirements:\n1. Generate ONLY tough, high-difficulty questions that require deep understanding of the subject\n2. Take reference from standard UPSC and SSC CGL preparation books and past exam papers\n3. NEVER repeat questions that are commonly asked; create unique questions that test advanced concepts\n4. Use high-level question-forming techniques with complex distractors that require critical thinking\n5. Cover ALL subjects relevant to UPSC/SSC CGL: Indian History, Geography, Polity, Economics, Science, Current Affairs, Reasoning, Quantitative Aptitude, English, etc.\n6. Question MUST be shown in both English and Hindi with accurate translations\n7. Hindi translation must be grammatically correct\n8. Each option MUST have both English and Hindi versions separated by ' / '\n9. Options MUST start with A), B), C), D) followed by a space\n10. Use proper Hindi Unicode characters\n11. Keep formatting consistent throughout"
+_BATCH_CONTENT = f"Generate {QUESTION_BATCH_SIZE} different questions in the format above, each on a different topic. Separate consecutive questions with a line containing only ---"
+_BASE_MESSAGES = (
+    {"role": "system", "content": _INSTRUCTION_CONTENT},
+    {"role": "system", "content": _BATCH_CONTENT},
+)
+# Separator line between questions in a batched response
+_BATCH_SEPARATOR_RE = re.compile(r'^\s*-{3,}\s*$', re.M)
+
+# Algorithm used for question fingerprints, recorded in the database
+HASH_ALGO = 'blake2b-128-norm'
+
+# Shared connection to the questions database, opened once per process
+_DB_CONN = None
+# Generated questions waiting to be sent, loaded from disk on first use
+_QUESTION_QUEUE = None
+
+# Create a hash of the question to use as a unique identifier.
+# Case and whitespace are normalised first so trivially reworded repeats collide.
+def hash_question(question):
+    normalized = ' '.join(question.casefold().split())
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+# Replace all stored questions, recomputing their hashes (duplicates are dropped)
+def _rebuild_questions(conn, rows):
+    conn.execute("BEGIN")
+    try:
+        conn.execute("DELETE FROM questions")
+        conn.executemany(
+            "INSERT OR IGNORE INTO questions (hash, question, date_added) VALUES (?, ?, ?)",
+            [(hash_question(question), question, date_added) for question, date_added in rows]
+        )
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('hash_algo', ?)", (HASH_ALGO,))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+# Import questions from the JSON file used before the SQLite store
+def _load_legacy_questions():
+    if not os.path.exists(LEGACY_QUESTIONS_PATH):
+        return []
+    try:
+        with open(LEGACY_QUESTIONS_PATH, 'rb') as f:
+            data = orjson.loads(f.read())
+    except orjson.JSONDecodeError:
+        logger.error("Error decoding legacy questions file, skipping import")
+        return []
+    return [(q["question"], q["date_added"]) for q in data.get("questions", [])]
 
 # Initialize or load the questions database
 def load_questions_db():
-    if os.path.exists(QUESTIONS_DB_PATH):
-        try:
-            with open(QUESTIONS_DB_PATH, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            logger.error("Error decoding questions database, creating new one")
-            return {"questions": []}
-    else:
-        return {"questions": []}
+    global _DB_CONN
+    if _DB_CONN is not None:
+        return _DB_CONN
+    
+    conn = sqlite3.connect(QUESTIONS_DB_PATH, isolation_level=None)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS questions ("
+        "hash TEXT PRIMARY KEY, question TEXT NOT NULL, date_added TEXT NOT NULL)"
+    )
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    
+    row = conn.execute("SELECT value FROM meta WHERE key = 'hash_algo'").fetchone()
+    if row is None:
+        # Fresh database: seed it from the old JSON file if there is one
+        legacy_rows = _load_legacy_questions()
+        _rebuild_questions(conn, legacy_rows)
+        if legacy_rows:
+            logger.info("Imported %d questions from %s", len(legacy_rows), LEGACY_QUESTIONS_PATH)
+    elif row[0] != HASH_ALGO:
+        # Rehash entries written with an older algorithm
+        rows = conn.execute("SELECT question, date_added FROM questions ORDER BY rowid").fetchall()
+        _rebuild_questions(conn, rows)
+    
+    _DB_CONN = conn
+    return _DB_CONN
+
+def count_questions():
+    return load_questions_db().execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+# Most recently asked questions, oldest first
+def get_recent_questions(limit):
+    rows = load_questions_db().execute(
+        "SELECT question FROM questions ORDER BY rowid DESC LIMIT ?", (limit,)
+    ).fetchall()
+    return [row[0] for row in reversed(rows)]
+
+def is_question_asked(question):
+    row = load_questions_db().execute(
+        "SELECT 1 FROM questions WHERE hash = ?", (hash_question(question),)
+    ).fetchone()
+    return row is not None
 
 # Save questions to database
 def save_question_to_db(question):
-    db = load_questions_db()
+    conn = load_questions_db()
+    
+    # The primary key on hash rejects questions that have been asked before
+    cursor = conn.execute(
+        "INSERT OR IGNORE INTO questions (hash, question, date_added) VALUES (?, ?, ?)",
+        (hash_question(question), question, datetime.now().isoformat(sep=' ', timespec='seconds'))
+    )
+    if cursor.rowcount == 0:
+        logger.info("Question has been asked before, not saving")
+        return False
     
-    # Create a hash of the question to use as a unique identifier
-    question_hash = hashlib.md5(question.encode('utf-8')).hexdigest()
+    logger.info("Added new question to database. Total questions: %d", count_questions())
+    return True
+
+# Load the queue of generated questions that have not been sent yet
+def load_question_queue():
+    global _QUESTION_QUEUE
+    if _QUESTION_QUEUE is not None:
+        return _QUESTION_QUEUE
     
-    # Check if this question (or very similar) has been asked before
-    for q in db["questions"]:
-        if q["hash"] == question_hash:
-            logger.info("Question has been asked before, not saving")
-            return False
+    items = []
+    if os.path.exists(QUESTION_QUEUE_PATH):
+        try:
+            with open(QUESTION_QUEUE_PATH, 'rb') as f:
+                items = orjson.loads(f.read())
+        except orjson.JSONDecodeError:
+            logger.error("Error decoding question queue, starting with an empty queue")
     
-    # Add the new question
-    db["questions"].append({
-        "hash": question_hash,
-        "question": question,
-        "date_added": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
+    _QUESTION_QUEUE = deque((q["question"], q["options"], q["correct_index"]) for q in items)
+    return _QUESTION_QUEUE
+
+# Persist the queue so a restart does not pay for the same batch again
+def save_question_queue():
+    items = [
+        {"question": question, "options": options, "correct_index": correct_index}
+        for question, options, correct_index in load_question_queue()
+    ]
+    tmp_path = QUESTION_QUEUE_PATH + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, QUESTION_QUEUE_PATH)
+
+# Parse a generated question into (question, options, correct_index) in a
+# single pass over its lines; returns (None, None, None) if the format is off
+def parse_quiz_question(question_text):
+    question_lines = []
+    options = []
+    correct_answer = None
     
-    # Save the updated database
-    with open(QUESTIONS_DB_PATH, 'w', encoding='utf-8') as f:
-        json.dump(db, f, ensure_ascii=False, indent=2)
+    for line in question_text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        
+        if line[:3] in _OPT_PREFIXES:
+            option_text = line[3:].strip()  # Remove "X) " prefix
+            if option_text and '/' in option_text:  # Ensure option has both languages
+                options.append(option_text)
+            continue
+        
+        # Correct answer, in either English or Hindi format
+        answer_match = _ANS_RE.search(line)
+        if answer_match:
+            correct_answer = answer_match.group(1)
+            continue
+        
+        # Leading lines are the question (English and Hindi)
+        if not options and correct_answer is None:
+            question_lines.append(line)
     
-    logger.info(f"Added new question to database. Total questions: {len(db['questions'])}")
-    return True
+    if len(question_lines) != 2:
+        logger.error("Invalid question format. Expected 2 lines, got %d", len(question_lines))
+        logger.debug("Response content: %s", question_text)
+        return None, None, None
+        
+    question = '\n'.join(question_lines)
+    
+    if len(options) != 4:
+        logger.error("Invalid number of options: %d. Raw response: %s", len(options), question_text)
+        return None, None, None
+    
+    if correct_answer is None:
+        logger.error("Invalid correct answer format: %s", question_text)
+        return None, None, None
+    
+    # Convert Hindi letters to English if needed
+    correct_answer = _HINDI_TO_ENG.get(correct_answer, correct_answer)
+        
+    if correct_answer not in _VALID_LETTERS:
+        logger.error("Invalid correct answer value: %s", correct_answer)
+        return None, None, None
+        
+    correct_index = ord(correct_answer) - ord('A')
+    return question, options, correct_index
 
-async def generate_quiz_question():
+# Request a batch of questions from OpenAI; returns the ones that parsed and are new
+async def generate_question_batch():
     try:
-        # Load previously asked questions to provide as context
-        db = load_questions_db()
-        
         # Get the number of previously asked questions
-        num_previous_questions = len(db["questions"])
+        num_previous_questions = count_questions()
         
         # Create a context message with information about previously asked questions
         context_message = {
             "role": "system",
-            "content": f"You have previously generated {num_previous_questions} questions. Ensure you create a completely new and unique question that has not been asked before."
-        }
-        
-        # Main instruction message
-        instruction_message = {
-            "role": "system",
-            "content": "Generate a challenging multiple choice question for UPSC/SSC CGL exam preparation. Follow this EXACT format and example:\n\nExample Output:\nWho was the first President of India?\nभारत के प्रथम राष्ट्रपति कौन थे?\n\nA) Dr. Rajendra Prasad / डॉ राजेंद्र प्रसाद\nB) Jawaharlal Nehru / जवाहरलाल नेहरू\nC) Sardar Vallabhbhai Patel / सरदार वल्लभभाई पटेल\nD) Dr. A.P.J. Abdul Kalam / डॉ ए पी जे अब्दुल कलाम\n\nCorrect: A\n\nRequirements:\n1. Generate ONLY tough, high-difficulty questions that require deep understanding of the subject\n2. Take reference from standard UPSC and SSC CGL preparation books and past exam papers\n3. NEVER repeat questions that are commonly asked; create unique questions that test advanced concepts\n4. Use high-level question-forming techniques with complex distractors that require critical thinking\n5. Cover ALL subjects relevant to UPSC/SSC CGL: Indian History, Geography, Polity, Economics, Science, Current Affairs, Reasoning, Quantitative Aptitude, English, etc.\n6. Question MUST be shown in both English and Hindi with accurate translations\n7. Hindi translation must be grammatically correct\n8. Each option MUST have both English and Hindi versions separated by ' / '\n9. Options MUST start with A), B), C), D) followed by a space\n10. Use proper Hindi Unicode characters\n11. Keep formatting consistent throughout"
+            "content": f"You have previously generated {num_previous_questions} questions. Ensure you create completely new and unique questions that have not been asked before."
         }
         
         # Add recent questions as examples of what not to repeat (if available)
@@ -103,101 +270,69 @@ async def generate_quiz_question():
         if num_previous_questions > 0:
             # Get the 5 most recent questions or all if less than 5
             recent_count = min(5, num_previous_questions)
-            recent_questions = db["questions"][-recent_count:]
+            recent_questions = get_recent_questions(recent_count)
             
         avoid_message = None
         if recent_questions:
             avoid_content = "DO NOT repeat these recently asked questions or anything too similar:\n\n"
+            # Only the English line of each question, to keep the prompt a fixed size
             for i, q in enumerate(recent_questions):
-                avoid_content += f"{i+1}. {q['question']}\n\n"
+                avoid_content += f"{i+1}. {q.splitlines()[0]}\n"
             
             avoid_message = {
                 "role": "system",
                 "content": avoid_content
             }
         
-        # Construct the messages array
-        messages = [context_message, instruction_message]
+        # Construct the messages array; the static messages lead so the prompt
+        # prefix is byte-identical across calls and can be served from OpenAI's cache
         if avoid_message:
-            messages.append(avoid_message)
-        
-        response = client.chat.completions.create(
-             model="gpt-3.5-turbo",
-             messages=messages,
-             temperature=0.7,
-             max_tokens=400
-         )
+            messages = [*_BASE_MESSAGES, context_message, avoid_message]
+        else:
+            messages = [*_BASE_MESSAGES, context_message]
         
-        question_text = response.choices[0].message.content.strip()
+        response = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0.7,
+            max_tokens=400 * QUESTION_BATCH_SIZE
+        )
         
-        # Parse the response with better error handling
-        parts = question_text.split('\n\n')  # Split by double newlines to separate sections
+        response_text = response.choices[0].message.content.strip()
         
-        if len(parts) < 2:  # At least questions and options sections
-            logger.error(f"Invalid response format. Got {len(parts)} sections, expected at least 2")
-            logger.debug(f"Response content: {question_text}")
-            return None, None, None
-            
-        # Extract questions (English and Hindi)
-        question_lines = parts[0].strip().split('\n')
-        if len(question_lines) != 2:
-            logger.error(f"Invalid question format. Expected 2 lines, got {len(question_lines)}")
-            return None, None, None
+        batch = []
+        seen = set()
+        for question_text in _BATCH_SEPARATOR_RE.split(response_text):
+            question, options, correct_index = parse_quiz_question(question_text)
+            if question is None:
+                continue
             
-        question = '\n'.join(question_lines)
-        
-        # Extract and validate options
-        options = []
-        option_lines = parts[1].strip().split('\n')
-        
-        for line in option_lines:
-            if any(line.startswith(f"{chr(ord('A') + i)}) ") for i in range(4)):
-                option_text = line[3:].strip()  # Remove "X) " prefix
-                if option_text and '/' in option_text:  # Ensure option has both languages
-                    options.append(option_text)
+            # Drop repeats within the batch and questions asked before
+            question_hash = hash_question(question)
+            if question_hash in seen or is_question_asked(question):
+                logger.info("Dropping repeated question from batch")
+                continue
+            seen.add(question_hash)
+            batch.append((question, options, correct_index))
         
-        if len(options) != 4:
-            logger.error(f"Invalid number of options: {len(options)}. Raw options: {option_lines}")
-            return None, None, None
-        
-        # Extract and validate correct answer
-        correct_line = parts[-1].strip() if len(parts) > 2 else option_lines[-1].strip()
-        
-        # Find the correct answer line
-        for line in reversed(option_lines):
-            if line.startswith("Correct:") or line.startswith("सही उत्तर:"):
-                correct_line = line
-                break
-        
-        # Extract correct answer letter, handling both English and Hindi formats
-        if "Correct:" in correct_line:
-            correct_answer = correct_line.split("Correct:", 1)[1].strip()
-        elif "सही उत्तर:" in correct_line:
-            correct_answer = correct_line.split("सही उत्तर:", 1)[1].strip()
-        else:
-            logger.error(f"Invalid correct answer format: {correct_line}")
-            return None, None, None
-            
-        # Extract the letter from potential formats like "A) option / विकल्प"
-        if "/" in correct_answer:
-            correct_answer = correct_answer.split("/")[0].strip()
-        if ")" in correct_answer:
-            correct_answer = correct_answer.split(")")[0].strip()
-            
-        # Convert Hindi letters to English if needed
-        hindi_to_eng = {'ए': 'A', 'बी': 'B', 'सी': 'C', 'डी': 'D'}
-        if correct_answer in hindi_to_eng:
-            correct_answer = hindi_to_eng[correct_answer]
-            
-        if correct_answer not in ['A', 'B', 'C', 'D']:
-            logger.error(f"Invalid correct answer value: {correct_answer}")
-            return None, None, None
-            
-        correct_index = ord(correct_answer) - ord('A')
-        return question, options, correct_index
+        logger.info("Generated %d new questions in one request", len(batch))
+        return batch
     except Exception as e:
-        logger.error(f"Error generating question: {e}")
+        logger.error("Error generating question: %s", e)
+        return []
+
+async def generate_quiz_question():
+    queue = load_question_queue()
+    if not queue:
+        queue.extend(await generate_question_batch())
+    
+    if not queue:
         return None, None, None
+    
+    quiz = queue.popleft()
+    save_question_queue()
+    logger.info("%d generated questions left in queue", len(queue))
+    return quiz
 
 async def send_quiz(bot):
     try:
@@ -213,7 +348,7 @@ async def send_quiz(bot):
         if not is_new:
             logger.warning("Generated question was too similar to a previous one, but proceeding anyway")
             
-        logger.info(f"Sending quiz: {question[:50]}...")
+        logger.info("Sending quiz: %.50s...", question)
         await bot.send_poll(
             chat_id=CHANNEL_ID,
             question=question,
@@ -221,65 +356,87 @@ async def send_quiz(bot):
             type=Poll.QUIZ,
             correct_option_id=correct_index,
             is_anonymous=True,
-            explanation=f"Correct answer: {chr(correct_index + ord('A'))}"
+            explanation=_EXPLANATIONS[correct_index]
         )
         logger.info("Quiz sent successfully")
         
     except TelegramError as e:
-        logger.error(f"Telegram error while sending quiz: {e}")
+        logger.error("Telegram error while sending quiz: %s", e)
         if 'Forbidden' in str(e):
             logger.error("Bot might not have proper permissions in the channel")
         elif 'Bad Request' in str(e):
             logger.error("Invalid quiz format or channel ID")
     except Exception as e:
-        logger.error(f"Unexpected error while sending quiz: {e}", exc_info=True)
+        logger.error("Unexpected error while sending quiz: %s", e, exc_info=True)
+
+# Build the Telegram bot; one instance (and its HTTP/2 connection pool) is reused for every call
+def create_bot():
+    return Bot(TELEGRAM_TOKEN, request=HTTPXRequest(http_version="2", connection_pool_size=4))
+
+# Scheduled job: send one quiz, retrying with backoff if something escapes send_quiz
+async def quiz_job(bot):
+    max_retries = 3
+    
+    for retry_count in range(1, max_retries + 1):
+        try:
+            await send_quiz(bot)
+            return
+            
+        except Exception as e:
+            logger.error("Quiz job error (attempt %d/%d): %s", retry_count, max_retries, e, exc_info=True)
+            
+            if retry_count >= max_retries:
+                logger.error("Maximum retry attempts reached, waiting for next scheduled run")
+                return
+            
+            # Max wait time of 5 minutes, plus jitter so instances don't retry in lockstep
+            wait_time = min(60 * retry_count, 300) + random.uniform(0, 10)
+            logger.info("Waiting %.1f seconds before retrying...", wait_time)
+            await asyncio.sleep(wait_time)
+
+# Send a single quiz and exit, for running from cron or a systemd timer
+async def send_quiz_once():
+    async with create_bot() as bot:
+        load_questions_db()
+        await quiz_job(bot)
 
 async def main():
     logger.info("Starting UPSC SSC CGL Quiz Bot...")
     try:
-        bot = Bot(TELEGRAM_TOKEN)
-        # Verify bot token by getting bot information
-        bot_info = await bot.get_me()
-        logger.info(f"Bot initialized successfully: @{bot_info.username}")
+        bot = create_bot()
+        # Verify bot token; initialize() fetches the bot information once and caches it
+        await bot.initialize()
+        logger.info("Bot initialized successfully: @%s", bot.username)
         
-        retry_count = 0
-        max_retries = 3
+        # Open the questions database once; later calls reuse the connection
+        load_questions_db()
+        logger.info("Loaded %d previously asked questions", count_questions())
         
-        while True:
-            try:
-                current_time = datetime.now()
-                logger.info(f"Current time: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                await send_quiz(bot)
-                # Reset retry count after successful quiz
-                retry_count = 0
-                
-                # Wait for 1 hour before sending the next quiz
-                logger.info("Waiting for 1 hour before sending next quiz...")
-                await asyncio.sleep(3600)
-                
-            except Exception as e:
-                retry_count += 1
-                wait_time = min(60 * retry_count, 300)  # Max wait time of 5 minutes
-                
-                logger.error(f"Main loop error (attempt {retry_count}/{max_retries}): {e}", exc_info=True)
-                
-                if retry_count >= max_retries:
-                    logger.error("Maximum retry attempts reached, resetting retry counter")
-                    retry_count = 0
-                
-                logger.info(f"Waiting {wait_time} seconds before retrying...")
-                await asyncio.sleep(wait_time)
+        # Send a quiz now and then every hour
+        scheduler = AsyncIOScheduler()
+        scheduler.add_job(
+            quiz_job, 'interval', hours=1, args=[bot],
+            next_run_time=datetime.now(), coalesce=True, max_instances=1
+        )
+        scheduler.start()
+        logger.info("Scheduled a quiz every hour")
+        
+        # Keep the event loop alive for the scheduler
+        await asyncio.Event().wait()
                 
     except Exception as e:
-        logger.critical(f"Critical error in main loop: {e}", exc_info=True)
+        logger.critical("Critical error in main loop: %s", e, exc_info=True)
         raise
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="UPSC SSC CGL Quiz Bot")
+    parser.add_argument('--once', action='store_true', help="send a single quiz and exit (for cron/systemd timers)")
+    args = parser.parse_args()
+    
     try:
-        asyncio.run(main())
+        asyncio.run(send_quiz_once() if args.once else main())
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.critical(f"Fatal error: {e}", exc_info=True)
+        logger.critical("Fatal error: %s", e, exc_info=True)
         raise
\ No newline at end of file